@@ -6,26 +6,107 @@ Recursively searches PDF files for regex patterns and outputs results in JSON fo
 """
 
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
 
 from src.arg_parser import parse_arguments
-from src.term_loader import load_term_list
+from src.term_loader import load_term_list, CombinedPattern
 from src.file_scanner import scan_directory
 from src.pdf_processor import process_pdf_file
 from src.result_aggregator import ResultAggregator
-from src.logger import setup_logger, log_exception
+from src.logger import setup_logger, set_log_level, log_exception
+
+
+# Job settings for _process_file, set once per process by _init_worker so
+# the compiled patterns are not pickled with every task
+_PATTERNS = None
+_CONTEXT_BEFORE = 50
+_CONTEXT_AFTER = 50
+_PAGE_WORKERS = 1
+
+
+def _init_worker(patterns, context_before, context_after, page_workers):
+    """Store the job settings used by _process_file in this process."""
+    global _PATTERNS, _CONTEXT_BEFORE, _CONTEXT_AFTER, _PAGE_WORKERS
+
+    _PATTERNS = patterns
+    _CONTEXT_BEFORE = context_before
+    _CONTEXT_AFTER = context_after
+    _PAGE_WORKERS = page_workers
+
+
+def _process_file(file_path):
+    """
+    Process a single file, capturing any error so one bad file does not
+    abort the remaining files when run in a worker process.
+
+    Returns:
+        Tuple of (matches, page count, exception or None)
+    """
+    try:
+        results, page_count, _ = process_pdf_file(
+            file_path,
+            _PATTERNS,
+            _CONTEXT_BEFORE,
+            _CONTEXT_AFTER,
+            _PAGE_WORKERS
+        )
+        return results, page_count, None
+    except Exception as e:
+        return [], 0, e
+
+
+def _process_files(file_paths):
+    """
+    Process a group of files in one worker task.
+
+    Returns:
+        List of (matches, page count, exception or None), one per file
+    """
+    return [_process_file(file_path) for file_path in file_paths]
+
+
+def _iter_completed(futures, unprocessed):
+    """
+    Yield file outcomes from worker tasks as the tasks complete.
+
+    Tasks lost to a broken process pool are skipped and their files added
+    to unprocessed, so outcomes of the tasks that did finish are kept.
+
+    Args:
+        futures: Dictionary mapping futures to the files of their task
+        unprocessed: List to add the files of failed tasks to
+
+    Yields:
+        Tuples of (file path, (matches, page count, exception or None))
+    """
+    for future in as_completed(futures):
+        try:
+            outcomes = future.result()
+        except BrokenProcessPool as e:
+            if not unprocessed:
+                log_exception("Worker process terminated unexpectedly", e)
+            unprocessed.extend(futures[future])
+            continue
+
+        yield from zip(futures[future], outcomes)
 
 
 def main():
     """Main execution function."""
     start_time = datetime.now()
     logger = setup_logger()
+    aggregator = None
 
     try:
         # Parse command-line arguments
         args = parse_arguments()
 
+        if args.verbose:
+            set_log_level("DEBUG")
+
         # Load regex term list
         logger.info(f"Loading term list from: {args.term_list_path}")
         term_list = load_term_list(args.term_list_path)
@@ -35,47 +116,98 @@ def main():
             sys.exit(1)
 
         logger.info(f"Loaded {len(term_list)} search terms")
-
-        # Initialize result aggregator
-        aggregator = ResultAggregator(
-            context_before=args.context_before,
-            context_after=args.context_after
-        )
+        patterns = CombinedPattern(term_list)
 
         # Scan directory for files
         logger.info(f"Scanning directory: {args.scan_folder}")
         files_to_process = scan_directory(
             args.scan_folder,
             args.file_extensions,
-            args.recursive
+            args.recursive,
+            largest_first=args.workers > 1
         )
 
         logger.info(f"Found {len(files_to_process)} files to process")
 
-        # Process each file
-        for file_path in files_to_process:
-            try:
-                logger.info(f"Processing: {file_path}")
-                results, page_count = process_pdf_file(
-                    file_path,
-                    term_list,
-                    args.context_before,
-                    args.context_after
-                )
-                aggregator.add_results(file_path, results, page_count)
-            except Exception as e:
-                log_exception(f"Error processing {file_path}", e)
+        # Results are streamed to the output folder as files are processed
+        output_path = Path(args.output_folder)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        results_file = output_path / f"results_{start_time.strftime('%Y%m%d_%H%M%S')}.json"
+
+        # Initialize result aggregator
+        aggregator = ResultAggregator(
+            context_before=args.context_before,
+            context_after=args.context_after,
+            output_path=results_file
+        )
+
+        # Process files, in parallel when more than one worker is requested
+        job_settings = (
+            patterns,
+            args.context_before,
+            args.context_after,
+            args.page_workers
+        )
+        workers = min(args.workers, len(files_to_process))
+        executor = None
+
+        if workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=job_settings
+            )
+        else:
+            _init_worker(*job_settings)
+
+        # Files lost when a worker process dies
+        unprocessed = []
+
+        try:
+            if executor is not None:
+                # Several files per task cut IPC round trips, while leaving
+                # enough tasks to balance the load across workers. Files are
+                # dealt round-robin from the largest down, so the largest
+                # files land in different tasks
+                task_count = min(len(files_to_process), workers * 4)
+                tasks = [files_to_process[start::task_count] for start in range(task_count)]
+                futures = {executor.submit(_process_files, task): task for task in tasks}
+                outcomes = _iter_completed(futures, unprocessed)
+            else:
+                outcomes = zip(files_to_process, map(_process_file, files_to_process))
+
+            file_total = len(files_to_process)
+            for index, (file_path, (results, page_count, error)) in enumerate(outcomes, start=1):
+                logger.debug("Processed: %s", file_path)
+                if index % 100 == 0:
+                    logger.info("Processed %d/%d files", index, file_total)
+
+                if error is not None:
+                    log_exception(f"Error processing {file_path}", error)
+                    continue
+                aggregator.add_results(file_path, results, page_count=page_count)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if unprocessed:
+            for file_path in unprocessed:
+                logger.warning("Not processed: %s", file_path)
+            # The results file is completed as incomplete on the way out
+            logger.error(
+                "%d of %d files were not processed; saved partial results",
+                len(unprocessed),
+                len(files_to_process)
+            )
+            sys.exit(1)
 
         # Generate outputs
         end_time = datetime.now()
         elapsed_time = (end_time - start_time).total_seconds()
 
-        # Save results
-        output_path = Path(args.output_folder)
-        output_path.mkdir(parents=True, exist_ok=True)
-
-        results_file = output_path / f"results_{start_time.strftime('%Y%m%d_%H%M%S')}.json"
-        aggregator.save_results(results_file)
+        # Complete the streamed results file
+        aggregator.save_results()
         logger.info(f"Results saved to: {results_file}")
 
         # Generate summary report if requested
@@ -103,6 +235,10 @@ def main():
     except Exception as e:
         log_exception("Fatal error in main execution", e)
         sys.exit(1)
+    finally:
+        # Leave a valid results file with the matches found so far
+        if aggregator is not None:
+            aggregator.close()
 
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Handles command-line argument parsing for the PDF pattern matcher.
 """
 
 import argparse
+import os
 from pathlib import Path
 
 
@@ -83,6 +84,22 @@ Examples:
         help="Number of characters to include after matched term (default: 50)"
     )
 
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=min(os.cpu_count() or 1, 4),
+        dest="workers",
+        help="Number of worker processes for processing files (default: CPU count, up to 4)"
+    )
+
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=1,
+        dest="page_workers",
+        help="Number of processes to extract pages of large PDFs (8+ pages) with (default: 1)"
+    )
+
     parser.add_argument(
         "-S", "--summary",
         action="store_true",
@@ -127,4 +144,10 @@ Examples:
     if args.context_after < 0:
         parser.error("Context after must be non-negative")
 
+    if args.workers < 1:
+        parser.error("Workers must be at least 1")
+
+    if args.page_workers < 1:
+        parser.error("Page workers must be at least 1")
+
     return args
@@ -4,14 +4,16 @@ File Scanner Module
 Recursively scans directories for files matching target extensions.
 """
 
+import os
 from pathlib import Path
-from typing import List
+from typing import Iterator, List, Tuple
 
 
 def scan_directory(
     root_path: str,
     extensions: List[str],
-    recursive: bool = False
+    recursive: bool = False,
+    largest_first: bool = False
 ) -> List[Path]:
     """
     Scan directory for files matching target extensions.
@@ -20,6 +22,8 @@ def scan_directory(
         root_path: Root directory to scan
         extensions: List of file extensions to match (e.g., ['.pdf', '.txt'])
         recursive: Whether to scan subdirectories recursively
+        largest_first: Order files by size, largest first, instead of by
+            name, so long-running files start early when processed in parallel
 
     Returns:
         List of Path objects for matching files
@@ -37,25 +41,89 @@ def scan_directory(
         raise NotADirectoryError(f"Not a directory: {root_path}")
 
     # Normalize extensions to lowercase
-    extensions = [ext.lower() for ext in extensions]
+    extensions = tuple(ext.lower() for ext in extensions)
 
-    matching_files = []
+    found = sorted(
+        _iter_matching_files(str(root), os.path.realpath(root), extensions, recursive),
+        key=lambda item: item[0]
+    )
 
-    if recursive:
-        # Recursive search
-        for ext in extensions:
-            # Use glob pattern **/* for recursive search
-            matching_files.extend(root.glob(f"**/*{ext}"))
-    else:
-        # Non-recursive search (only immediate children)
-        for ext in extensions:
-            matching_files.extend(root.glob(f"*{ext}"))
+    # Drop files reached more than once (e.g. through symlinks), keeping the
+    # first path in sorted order
+    seen = set()
+    unique = []
+    for file_path, real_path, entry in found:
+        if real_path not in seen:
+            seen.add(real_path)
+            unique.append((file_path, entry))
 
-    # Filter out directories and sort by name
-    files = [f for f in matching_files if f.is_file()]
-    files.sort()
+    if largest_first:
+        # Stable sort keeps name order among files of equal size
+        unique.sort(key=lambda item: _entry_size(item[1]), reverse=True)
 
-    return files
+    return [file_path for file_path, _ in unique]
+
+
+def _entry_size(entry: os.DirEntry) -> int:
+    """
+    Get the size of a directory entry, using its cached stat result.
+
+    Args:
+        entry: Directory entry from os.scandir
+
+    Returns:
+        File size in bytes, or 0 if it cannot be determined
+    """
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return 0
+
+
+def _iter_matching_files(
+    directory: str,
+    real_directory: str,
+    extensions: Tuple[str, ...],
+    recursive: bool
+) -> Iterator[Tuple[Path, str, os.DirEntry]]:
+    """
+    Yield files in a directory whose names end with one of the extensions.
+
+    Uses os.scandir so file and directory checks are answered from the
+    directory listing without an extra stat() per entry. Symlinked
+    directories are not followed, which also avoids symlink cycles.
+
+    Args:
+        directory: Directory to scan
+        real_directory: Canonical path of directory (symlinks resolved)
+        extensions: Lowercase file extensions to match
+        recursive: Whether to scan subdirectories recursively
+
+    Yields:
+        Tuples of (path of matching file, canonical path of the file,
+        directory entry of the file)
+    """
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if recursive:
+                    try:
+                        yield from _iter_matching_files(
+                            entry.path,
+                            os.path.join(real_directory, entry.name),
+                            extensions,
+                            recursive
+                        )
+                    except OSError:
+                        continue  # Skip unreadable directories, as os.walk does
+            elif entry.name.lower().endswith(extensions) and entry.is_file():
+                # Only symlinks need resolving; other entries sit directly
+                # under the already-canonical directory path
+                if entry.is_symlink():
+                    real_path = os.path.realpath(entry.path)
+                else:
+                    real_path = os.path.join(real_directory, entry.name)
+                yield Path(entry.path), real_path, entry
 
 
 def get_file_info(file_path: Path) -> dict:
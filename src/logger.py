@@ -77,6 +77,23 @@ def setup_logger(
     return logger
 
 
+def set_log_level(log_level: str) -> None:
+    """
+    Change the level of the application logger and its console output.
+
+    Args:
+        log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+    """
+    logger = logging.getLogger('pdf_pattern_matcher')
+    level = getattr(logging, log_level.upper())
+    logger.setLevel(level)
+
+    for handler in logger.handlers:
+        # File handlers already record everything down to DEBUG
+        if not isinstance(handler, logging.FileHandler):
+            handler.setLevel(level)
+
+
 def log_exception(message: str, exception: Exception) -> None:
     """
     Log an exception to the exception log file.
@@ -109,7 +126,9 @@ def log_exception(message: str, exception: Exception) -> None:
             f.write(f"Exception Type: {type(exception).__name__}\n")
             f.write(f"Exception: {str(exception)}\n")
             f.write(f"\nTraceback:\n")
-            f.write(traceback.format_exc())
+            f.write(''.join(traceback.format_exception(
+                type(exception), exception, exception.__traceback__
+            )))
             f.write(f"\n{'=' * 80}\n")
 
     except Exception as e:
@@ -4,15 +4,37 @@ PDF Processor Module
 Extracts text from PDF files using PyMuPDF and searches for regex patterns.
 """
 
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Iterator, List, Tuple
 import fitz  # PyMuPDF
 
+from .term_loader import CombinedPattern
+
+
+# Minimum page count before page extraction is split across processes
+PARALLEL_PAGE_THRESHOLD = 8
+
+# Files up to this size are read into memory in one pass before opening
+MAX_PRELOAD_BYTES = 200 * 1024 * 1024
+
 
 class PDFMatch:
     """Represents a single regex match in a PDF."""
 
+    # Matches can number in the millions; slots avoid a per-instance dict
+    __slots__ = (
+        'term_name',
+        'matched_text',
+        'page_number',
+        'context_before',
+        'context_after',
+        'position',
+        'file_name',
+        'file_path'
+    )
+
     def __init__(
         self,
         term_name: str,
@@ -20,7 +42,9 @@ class PDFMatch:
         page_number: int,
         context_before: str,
         context_after: str,
-        position: int
+        position: int,
+        file_name: str = '',
+        file_path: str = ''
     ):
         """
         Initialize a PDF match.
@@ -32,6 +56,8 @@ class PDFMatch:
             context_before: Text before the match
             context_after: Text after the match
             position: Character position of match in page text
+            file_name: Name of the file containing the match
+            file_path: Path of the file containing the match
         """
         self.term_name = term_name
         self.matched_text = matched_text
@@ -39,63 +65,223 @@ class PDFMatch:
         self.context_before = context_before
         self.context_after = context_after
         self.position = position
+        self.file_name = file_name
+        self.file_path = file_path
 
     def to_dict(self) -> dict:
         """Convert match to dictionary format."""
         return {
+            'file_name': self.file_name,
+            'file_path': self.file_path,
+            'page_number': self.page_number,
             'term_name': self.term_name,
             'matched_text': self.matched_text,
-            'page_number': self.page_number,
             'context_before': self.context_before,
             'context_after': self.context_after,
             'position': self.position
         }
 
 
-def extract_text_from_pdf(pdf_path: Path) -> Dict[int, str]:
+def _extract_page_range(pdf_path: Path, start: int, stop: int) -> List[str]:
     """
-    Extract text from PDF file, organized by page.
+    Extract text from a range of pages in its own document handle.
 
     Args:
         pdf_path: Path to PDF file
+        start: First page index (0-indexed, inclusive)
+        stop: Last page index (0-indexed, exclusive)
 
     Returns:
-        Dictionary mapping page numbers (1-indexed) to page text
+        List of page texts in page order
+    """
+    doc = fitz.open(pdf_path)
 
-    Raises:
-        Exception: If PDF cannot be opened or read
+    try:
+        return [doc[page_num].get_text("text", sort=False) for page_num in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _open_document(pdf_path: Path) -> fitz.Document:
     """
-    page_texts = {}
+    Open a document, reading it into memory first unless it is very large.
+
+    A single sequential read avoids the many small seeks PyMuPDF makes
+    while parsing a file in place, which are slow on network storage.
+
+    Args:
+        pdf_path: Path to PDF file
+
+    Returns:
+        Open PyMuPDF document
+    """
+    with open(pdf_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+
+        if size > MAX_PRELOAD_BYTES:
+            data = None
+        else:
+            if hasattr(os, 'posix_fadvise'):
+                try:
+                    os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_SEQUENTIAL)
+                except OSError:
+                    pass  # Only a hint; some network and FUSE filesystems reject it
+            data = f.read()
+
+    if data is None:
+        return fitz.open(pdf_path)
 
+    # Keep the type PyMuPDF would infer from the file name
+    filetype = Path(pdf_path).suffix.lstrip('.').lower() or 'pdf'
+    return fitz.open(stream=data, filetype=filetype)
+
+
+def _document_metadata(doc: fitz.Document) -> dict:
+    """
+    Build the metadata dictionary for an open PDF document.
+
+    Args:
+        doc: Open PyMuPDF document
+
+    Returns:
+        Dictionary containing PDF metadata
+    """
+    metadata = doc.metadata or {}
+
+    return {
+        'page_count': len(doc),
+        'title': metadata.get('title', ''),
+        'author': metadata.get('author', ''),
+        'subject': metadata.get('subject', ''),
+        'creator': metadata.get('creator', ''),
+        'producer': metadata.get('producer', ''),
+        'creation_date': metadata.get('creationDate', ''),
+        'modification_date': metadata.get('modDate', '')
+    }
+
+
+def _iter_page_texts(
+    doc: fitz.Document,
+    pdf_path: Path,
+    page_workers: int
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield the text of each page of an open document, then close it.
+
+    Args:
+        doc: Open PyMuPDF document
+        pdf_path: Path to PDF file
+        page_workers: Number of processes to extract pages with
+
+    Yields:
+        Tuples of (page number (1-indexed), page text)
+
+    Raises:
+        Exception: If a page cannot be read
+    """
     try:
-        doc = fitz.open(pdf_path)
+        page_count = len(doc)
 
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            text = page.get_text()
-            page_texts[page_num + 1] = text  # 1-indexed page numbers
+        if page_workers > 1 and page_count >= PARALLEL_PAGE_THRESHOLD:
+            range_size = -(-page_count // page_workers)  # Ceiling division
+            starts = list(range(0, page_count, range_size))
+            stops = [min(start + range_size, page_count) for start in starts]
+
+            with ProcessPoolExecutor(max_workers=len(starts)) as executor:
+                range_texts = executor.map(
+                    _extract_page_range,
+                    [pdf_path] * len(starts),
+                    starts,
+                    stops
+                )
+                for start, texts in zip(starts, range_texts):
+                    for offset, text in enumerate(texts):
+                        yield start + offset + 1, text  # 1-indexed page numbers
+        else:
+            for page_num in range(page_count):
+                page = doc[page_num]
+                text = page.get_text("text", sort=False)
+                yield page_num + 1, text  # 1-indexed page numbers
 
+    except Exception as e:
+        raise Exception(f"Failed to extract text from {pdf_path}: {e}")
+
+    finally:
         doc.close()
 
+
+def open_and_extract(
+    pdf_path: Path,
+    page_workers: int = 1
+) -> Tuple[dict, Iterator[Tuple[int, str]]]:
+    """
+    Open a PDF once and return its metadata along with its page texts.
+
+    Pages are yielded as they are extracted so each page's text can be
+    released once it has been searched. Text is extracted in content-stream
+    order (no layout sort), which is all the regex search needs. The
+    document is closed once all pages have been read.
+
+    PyMuPDF is not thread-safe, so when page_workers > 1 and the document
+    has at least PARALLEL_PAGE_THRESHOLD pages, the pages are split into
+    contiguous ranges and each range is extracted in a separate process
+    with its own document handle.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_workers: Number of processes to extract pages with
+
+    Returns:
+        Tuple of (metadata dictionary, iterator of (page number, page text))
+
+    Raises:
+        Exception: If PDF cannot be opened or read
+    """
+    try:
+        doc = _open_document(pdf_path)
     except Exception as e:
         raise Exception(f"Failed to extract text from {pdf_path}: {e}")
 
-    return page_texts
+    try:
+        metadata = _document_metadata(doc)
+    except Exception as e:
+        doc.close()
+        raise Exception(f"Failed to extract text from {pdf_path}: {e}")
+
+    return metadata, _iter_page_texts(doc, pdf_path, page_workers)
+
+
+def extract_text_from_pdf(pdf_path: Path, page_workers: int = 1) -> Iterator[Tuple[int, str]]:
+    """
+    Extract text from PDF file, one page at a time.
+
+    Args:
+        pdf_path: Path to PDF file
+        page_workers: Number of processes to extract pages with
+
+    Yields:
+        Tuples of (page number (1-indexed), page text)
+
+    Raises:
+        Exception: If PDF cannot be opened or read
+    """
+    _, page_texts = open_and_extract(pdf_path, page_workers)
+    yield from page_texts
 
 
 def search_text_for_patterns(
     text: str,
-    term_dict: Dict[str, str],
+    patterns: CombinedPattern,
     page_number: int,
     context_before: int,
     context_after: int
 ) -> List[PDFMatch]:
     """
-    Search text for regex patterns.
+    Search text for regex patterns in a single pass.
 
     Args:
         text: Text to search
-        term_dict: Dictionary mapping term names to regex patterns
+        patterns: Combined pattern built from the term list
         page_number: Page number for reporting
         context_before: Characters to include before match
         context_after: Characters to include after match
@@ -105,80 +291,77 @@ def search_text_for_patterns(
     """
     matches = []
 
-    for term_name, pattern in term_dict.items():
-        try:
-            regex = re.compile(pattern, re.IGNORECASE | re.MULTILINE)
-
-            for match in regex.finditer(text):
-                start_pos = match.start()
-                end_pos = match.end()
-
-                # Extract context
-                context_start = max(0, start_pos - context_before)
-                context_end = min(len(text), end_pos + context_after)
-
-                before_text = text[context_start:start_pos]
-                after_text = text[end_pos:context_end]
-                matched_text = match.group(0)
-
-                pdf_match = PDFMatch(
-                    term_name=term_name,
-                    matched_text=matched_text,
-                    page_number=page_number,
-                    context_before=before_text,
-                    context_after=after_text,
-                    position=start_pos
-                )
-
-                matches.append(pdf_match)
+    for term_name, match in patterns.finditer(text):
+        start_pos = match.start()
+        end_pos = match.end()
+
+        # Extract context
+        context_start = max(0, start_pos - context_before)
+        context_end = min(len(text), end_pos + context_after)
+
+        before_text = text[context_start:start_pos]
+        after_text = text[end_pos:context_end]
+        matched_text = text[start_pos:end_pos]
+
+        pdf_match = PDFMatch(
+            term_name=term_name,
+            matched_text=matched_text,
+            page_number=page_number,
+            context_before=before_text,
+            context_after=after_text,
+            position=start_pos
+        )
 
-        except re.error as e:
-            # Log regex errors but continue processing
-            print(f"Warning: Invalid regex for term '{term_name}': {e}")
-            continue
+        matches.append(pdf_match)
 
     return matches
 
 
 def process_pdf_file(
     file_path: Path,
-    term_dict: Dict[str, str],
+    patterns: CombinedPattern,
     context_before: int = 50,
-    context_after: int = 50
-) -> Tuple[List[PDFMatch], int]:
+    context_after: int = 50,
+    page_workers: int = 1
+) -> Tuple[List[PDFMatch], int, dict]:
     """
     Process a PDF file and search for patterns.
 
+    The document is opened once for both its metadata and its text.
+
     Args:
         file_path: Path to PDF file
-        term_dict: Dictionary of term names to regex patterns
+        patterns: Combined pattern built from the term list
         context_before: Characters to include before match
         context_after: Characters to include after match
+        page_workers: Number of processes to extract pages with
 
     Returns:
-        Tuple of (list of all matches found in the PDF, page count)
+        Tuple of (list of all matches found in the PDF, page count, metadata)
 
     Raises:
         Exception: If PDF processing fails
     """
     all_matches = []
 
-    # Extract text from all pages
-    page_texts = extract_text_from_pdf(file_path)
-    page_count = len(page_texts)
+    metadata, page_texts = open_and_extract(file_path, page_workers)
+
+    # Search each page as it is extracted
+    for page_num, page_text in page_texts:
+        # Skip pages without text (e.g. scanned images)
+        if not page_text or page_text.isspace():
+            continue
 
-    # Search each page
-    for page_num, page_text in page_texts.items():
         page_matches = search_text_for_patterns(
             page_text,
-            term_dict,
+            patterns,
             page_num,
             context_before,
             context_after
         )
         all_matches.extend(page_matches)
 
-    return all_matches, page_count
+    return all_matches, metadata['page_count'], metadata
 
 
 def get_pdf_metadata(pdf_path: Path) -> dict:
@@ -192,21 +375,13 @@ def get_pdf_metadata(pdf_path: Path) -> dict:
         Dictionary containing PDF metadata
     """
     try:
+        # Opened in place, since reading the metadata touches little of the file
         doc = fitz.open(pdf_path)
-        metadata = doc.metadata
-        page_count = len(doc)
-        doc.close()
 
-        return {
-            'page_count': page_count,
-            'title': metadata.get('title', ''),
-            'author': metadata.get('author', ''),
-            'subject': metadata.get('subject', ''),
-            'creator': metadata.get('creator', ''),
-            'producer': metadata.get('producer', ''),
-            'creation_date': metadata.get('creationDate', ''),
-            'modification_date': metadata.get('modDate', '')
-        }
+        try:
+            return _document_metadata(doc)
+        finally:
+            doc.close()
 
     except Exception:
         return {'page_count': 0, 'error': 'Unable to read metadata'}
@@ -5,32 +5,86 @@ Aggregates search results and generates output in JSON format.
 """
 
 import json
+import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 from .pdf_processor import PDFMatch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class ResultAggregator:
-    """Aggregates and manages search results."""
 
-    def __init__(self, context_before: int = 50, context_after: int = 50):
+def _dumps(obj, indent: bool = False) -> bytes:
+    """
+    Serialize an object to UTF-8 encoded JSON, using orjson when installed.
+
+    Args:
+        obj: Object to serialize
+        indent: Whether to indent nested structures by two spaces
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+class ResultAggregator:
+    """
+    Aggregates and manages search results.
+
+    When an output path is given, matches are streamed to a ".part" file
+    next to it as they are added and are not kept in memory; only the
+    counts needed for the summary are retained. The file is moved into
+    place once completed by save_results(), or by close() if the job ends
+    early. The grouping and CSV export helpers work on results kept in
+    memory.
+    """
+
+    def __init__(
+        self,
+        context_before: int = 50,
+        context_after: int = 50,
+        output_path: Optional[Path] = None
+    ):
         """
         Initialize result aggregator.
 
         Args:
             context_before: Characters included before matches
             context_after: Characters included after matches
+            output_path: Optional path to stream results to as they are added
         """
         self.context_before = context_before
         self.context_after = context_after
         self.results = []
-        self.match_counts = defaultdict(int)
+        self.match_counts = Counter()
+        self.total_matches = 0
         self.file_count = 0
         self.total_pages = 0
 
+        self._stream = None
+        self._stream_empty = True
+        self._output_path = output_path
+        self._partial_path = None
+
+        if output_path is not None:
+            self._partial_path = Path(f"{output_path}.part")
+            self._stream = open(self._partial_path, 'wb')
+            self._stream.write(b'{"matches": [')
+
     def add_results(self, file_path: Path, matches: List[PDFMatch], page_count: int = 0) -> None:
         """
         Add results from a file.
@@ -46,49 +100,101 @@ class ResultAggregator:
         if page_count > 0:
             self.total_pages += page_count
 
+        # Every match from this file shares the same name and path strings
+        file_name = file_path.name
+        file_path_str = sys.intern(str(file_path))
+
         for match in matches:
-            result = {
-                'file_name': file_path.name,
-                'file_path': str(file_path),
-                'page_number': match.page_number,
-                'term_name': match.term_name,
-                'matched_text': match.matched_text,
-                'context_before': match.context_before,
-                'context_after': match.context_after,
-                'position': match.position
-            }
+            match.file_name = file_name
+            match.file_path = file_path_str
+
+        if self._stream is not None:
+            for match in matches:
+                separator = b'\n' if self._stream_empty else b',\n'
+                self._stream.write(separator + _dumps(match.to_dict()))
+                self._stream_empty = False
+        else:
+            self.results.extend(matches)
 
-            self.results.append(result)
-            self.match_counts[match.term_name] += 1
+        self.match_counts.update(match.term_name for match in matches)
+        self.total_matches += len(matches)
 
     def get_total_matches(self) -> int:
         """Get total number of matches found."""
-        return len(self.results)
+        return self.total_matches
 
     def get_matches_by_term(self) -> Dict[str, int]:
         """Get count of matches by term name."""
         return dict(self.match_counts)
 
-    def save_results(self, output_path: Path) -> None:
+    def save_results(self, output_path: Optional[Path] = None) -> None:
         """
         Save results to JSON file.
 
+        If results are being streamed, this completes the streamed file by
+        appending the metadata, and output_path is ignored.
+
         Args:
             output_path: Path where results should be saved
         """
+        metadata = self._metadata()
+
+        if self._stream is not None:
+            self._finish_stream(metadata)
+            return
+
         output_data = {
-            'metadata': {
-                'total_matches': self.get_total_matches(),
-                'files_with_matches': self.file_count,
-                'context_before': self.context_before,
-                'context_after': self.context_after,
-                'generated_at': datetime.now().isoformat()
-            },
-            'matches': self.results
+            'metadata': metadata,
+            'matches': [match.to_dict() for match in self.results]
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(output_data, indent=True))
+
+    def close(self) -> None:
+        """
+        Complete a streamed results file that save_results() did not.
+
+        The matches added so far are kept, and the metadata is marked as
+        incomplete so the file is still valid JSON. Does nothing once the
+        results have been saved.
+        """
+        if self._stream is None:
+            return
+
+        metadata = self._metadata()
+        metadata['incomplete'] = True
+        self._finish_stream(metadata)
+
+    def _metadata(self) -> dict:
+        """Build the metadata section of the results file."""
+        return {
+            'total_matches': self.get_total_matches(),
+            'files_with_matches': self.file_count,
+            'context_before': self.context_before,
+            'context_after': self.context_after,
+            'generated_at': datetime.now().isoformat()
+        }
+
+    def _finish_stream(self, metadata: dict) -> None:
+        """
+        Close the streamed matches array, append the metadata and move the
+        file into place.
+
+        Args:
+            metadata: Metadata section of the results file
+        """
+        stream = self._stream
+        self._stream = None
+
+        try:
+            stream.write(b'\n],\n"metadata": ')
+            stream.write(_dumps(metadata, indent=True))
+            stream.write(b'}\n')
+        finally:
+            stream.close()
+
+        os.replace(self._partial_path, self._output_path)
 
     def save_summary(
         self,
@@ -97,7 +203,7 @@ class ResultAggregator:
         end_time: datetime,
         elapsed_time: float,
         files_scanned: int,
-        term_list: Dict[str, str],
+        term_list: Dict[str, re.Pattern],
         args = None
     ) -> None:
         """
@@ -147,12 +253,14 @@ class ResultAggregator:
                 'recursive': args.recursive,
                 'context_before': args.context_before,
                 'context_after': args.context_after,
+                'workers': args.workers,
+                'page_workers': args.page_workers,
                 'summary_report': args.summary_report,
                 'verbose': args.verbose
             }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(summary, indent=True))
 
     def get_results_by_file(self) -> Dict[str, List[dict]]:
         """
@@ -163,8 +271,8 @@ class ResultAggregator:
         """
         by_file = defaultdict(list)
 
-        for result in self.results:
-            by_file[result['file_name']].append(result)
+        for match in self.results:
+            by_file[match.file_name].append(match.to_dict())
 
         return dict(by_file)
 
@@ -177,8 +285,8 @@ class ResultAggregator:
         """
         by_term = defaultdict(list)
 
-        for result in self.results:
-            by_term[result['term_name']].append(result)
+        for match in self.results:
+            by_term[match.term_name].append(match.to_dict())
 
         return dict(by_term)
 
@@ -206,6 +314,18 @@ class ResultAggregator:
         ]
 
         with open(output_path, 'w', encoding='utf-8', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.results)
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(
+                (
+                    match.file_name,
+                    match.file_path,
+                    match.page_number,
+                    match.term_name,
+                    match.matched_text,
+                    match.context_before,
+                    match.context_after,
+                    match.position
+                )
+                for match in self.results
+            )
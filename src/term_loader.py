@@ -6,19 +6,60 @@ Loads regex patterns from CSV or JSON files.
 
 import json
 import csv
+import re
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
 
+from .logger import log_exception
 
-def load_term_list(file_path: str) -> Dict[str, str]:
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+
+# Flags applied to every term pattern
+REGEX_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Hyperscan equivalent of REGEX_FLAGS; used only to prefilter ASCII pages,
+# so unsupported constructs may be approximated (HS_FLAG_PREFILTER)
+if hyperscan is not None:
+    HYPERSCAN_FLAGS = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_PREFILTER
+    )
+
+
+def load_term_list(file_path: str) -> Dict[str, re.Pattern]:
     """
     Load regex term list from CSV or JSON file.
 
+    Patterns are compiled once here so they can be reused for every page
+    of every file. Invalid patterns are logged and skipped.
+
     Args:
         file_path: Path to the term list file
 
     Returns:
-        Dictionary mapping term names to regex patterns
+        Dictionary mapping term names to compiled regex patterns
 
     Raises:
         ValueError: If file format is unsupported
@@ -32,12 +73,411 @@ def load_term_list(file_path: str) -> Dict[str, str]:
     suffix = path.suffix.lower()
 
     if suffix == '.json':
-        return _load_json_terms(path)
+        term_dict = _load_json_terms(path)
     elif suffix == '.csv':
-        return _load_csv_terms(path)
+        term_dict = _load_csv_terms(path)
     else:
         raise ValueError(f"Unsupported file format: {suffix}. Use .json or .csv")
 
+    return compile_term_list(term_dict)
+
+
+def compile_term_list(term_dict: Dict[str, str]) -> Dict[str, re.Pattern]:
+    """
+    Compile regex patterns in a term list.
+
+    Args:
+        term_dict: Dictionary of term names to regex patterns
+
+    Returns:
+        Dictionary mapping term names to compiled regex patterns
+    """
+    compiled = {}
+
+    for name, pattern in term_dict.items():
+        try:
+            compiled[name] = re.compile(pattern, REGEX_FLAGS)
+        except re.error as e:
+            # Log regex errors but continue with the remaining terms
+            log_exception(f"Invalid regex for term '{name}'", e)
+
+    return compiled
+
+
+# Shortest literal worth screening pages for; shorter ones occur on
+# nearly every page
+MIN_LITERAL_LENGTH = 3
+
+# Column names recognized in a CSV header row, after lowercasing and
+# replacing spaces and hyphens with underscores. A column name may also
+# end in one of these, e.g. "Regex Pattern" or "Search Term"
+CSV_NAME_COLUMNS = {'name', 'term', 'term_name'}
+CSV_PATTERN_COLUMNS = {'pattern', 'regex', 'regexp', 'expression'}
+
+# Numbered backreferences and group conditionals shift meaning once a
+# pattern is wrapped in another group, so such patterns are never fused
+_GROUP_REFERENCE = re.compile(r'\\[1-9]|\(\?\(\d')
+
+# ASCII characters matched by \s in str patterns but not in bytes patterns
+# (\x1c-\x1f) or in re2 and hyperscan (\x0b)
+_STR_ONLY_WHITESPACE = re.compile('[\x0b\x1c-\x1f]')
+
+# Syntax that re2 and hyperscan read differently from re: {,n} repeats
+# (literal text in PCRE), POSIX classes such as [[:alpha:]], \N (named
+# characters in re, any non-newline in PCRE) and verbose mode
+_NON_PORTABLE_SYNTAX = re.compile(r'\{,|\[:|\\N|\(\?[aiLmsu-]*x')
+
+
+class CombinedPattern:
+    """
+    Term list matcher that scans each page for all terms.
+
+    The terms are also combined into one alternation regex, which is used
+    to check whether a page matches any term at all; pages without matches
+    then cost one pass instead of one per term. Pages hyperscan has screened
+    skip the check. Matches are found by running each term's own pattern,
+    so every term reports all of its matches even where they overlap
+    matches of other terms.
+
+    If the patterns cannot be combined (e.g. they use numbered
+    backreferences or clashing group names), the check is skipped.
+
+    ASCII pages are matched as bytes, which avoids re's Unicode case
+    folding; for ASCII text, byte offsets equal character offsets and the
+    ASCII-only bytes character classes give the same matches. The one
+    exception is \\s, which matches \\x0b and \\x1c-\\x1f differently across
+    engines, so pages containing those are matched as str.
+
+    Pages are prefiltered so only terms that can match are run through the
+    regex; terms that no prefilter can screen are run on every page.
+    Optional engines are used when installed, only on ASCII pages:
+    - hyperscan: terms it reads the same way as re (see _is_portable) are
+      compiled into one database that reports which of them can match a
+      page in linear time.
+    - pyahocorasick: other terms that require a literal string are
+      screened by finding those literals with one Aho-Corasick pass.
+    - re2 (google-re2): runs portable term patterns instead of the bytes
+      patterns.
+    """
+
+    def __init__(self, term_dict: Dict[str, re.Pattern]):
+        """
+        Build the combined pattern.
+
+        Args:
+            term_dict: Dictionary mapping term names to compiled regex patterns
+        """
+        self.term_dict = term_dict
+        self.regex = None
+
+        self._names = list(term_dict)
+        self._regexes = list(term_dict.values())
+
+        if term_dict and not any(
+            regex.groups and _GROUP_REFERENCE.search(regex.pattern)
+            for regex in self._regexes
+        ):
+            try:
+                self.regex = re.compile(
+                    "|".join(f"(?:{regex.pattern})" for regex in self._regexes),
+                    REGEX_FLAGS
+                )
+            except re.error:
+                pass
+
+        # Whether re2 and hyperscan read each term the same way as re
+        self._portable = [_is_portable(regex) for regex in self._regexes]
+
+        # Literal each term's matches must contain, by term index
+        self._literals = {}
+        for index, regex in enumerate(self._regexes):
+            literal = _required_literal(regex)
+            if literal is not None:
+                self._literals[index] = literal
+
+        self._all_terms = frozenset(range(len(term_dict)))
+
+        self._build_engines()
+
+    def _build_engines(self) -> None:
+        """
+        Compile the optional hyperscan and Aho-Corasick prefilters.
+
+        Hyperscan screens the terms that _is_portable accepts and
+        Aho-Corasick the remaining terms that require a literal. Terms
+        neither engine can screen are run on every page.
+        """
+        self._hyperscan_db = None
+        self._hyperscan_terms = frozenset()
+        self._automaton = None
+        self._automaton_terms = frozenset()
+
+        # (str regex, ASCII matcher, whether the ASCII matcher takes bytes)
+        # for each term, and for the combined regex
+        self._term_matchers = [
+            _compile_matchers(regex, portable)
+            for regex, portable in zip(self._regexes, self._portable)
+        ]
+        self._combined_matchers = None
+        if self.regex is not None:
+            self._combined_matchers = _compile_matchers(self.regex, all(self._portable))
+
+        if hyperscan is not None:
+            portable = [index for index, portable in enumerate(self._portable) if portable]
+            self._hyperscan_db = _compile_hyperscan(self._regexes, portable)
+
+            if self._hyperscan_db is None:
+                # Leave out the patterns hyperscan rejects
+                portable = [
+                    index for index in portable
+                    if _compile_hyperscan(self._regexes, [index]) is not None
+                ]
+                self._hyperscan_db = _compile_hyperscan(self._regexes, portable)
+
+            if self._hyperscan_db is not None:
+                self._hyperscan_terms = frozenset(portable)
+
+        literals = {
+            index: literal for index, literal in self._literals.items()
+            if index not in self._hyperscan_terms
+        }
+
+        if ahocorasick is not None and literals:
+            terms_by_literal = defaultdict(list)
+            for index, literal in literals.items():
+                terms_by_literal[literal].append(index)
+
+            automaton = ahocorasick.Automaton()
+            for literal, indices in terms_by_literal.items():
+                automaton.add_word(literal, tuple(indices))
+            automaton.make_automaton()
+            self._automaton = automaton
+            self._automaton_terms = frozenset(literals)
+
+        self._unscreened_terms = self._all_terms - self._hyperscan_terms - self._automaton_terms
+
+    def __getstate__(self) -> dict:
+        # Hyperscan databases and re2 regexes cannot be pickled
+        state = self.__dict__.copy()
+        del state['_hyperscan_db']
+        del state['_automaton']
+        del state['_term_matchers']
+        del state['_combined_matchers']
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._build_engines()
+
+    def _candidate_terms(self, text: str, data: Optional[bytes]) -> FrozenSet[int]:
+        """
+        Find the terms that can match text, using the available prefilters.
+
+        Each prefilter may report terms that do not match, but never leaves
+        out a term that does; pages a prefilter cannot screen keep all of
+        its terms.
+
+        Args:
+            text: Text to screen
+            data: ASCII encoding of text, or None if the text may only be
+                matched with re's str patterns
+
+        Returns:
+            Indices of terms that can match
+        """
+        hits = set(self._unscreened_terms)
+
+        if self._hyperscan_db is not None:
+            if data is None:
+                hits.update(self._hyperscan_terms)
+            else:
+                def on_match(term_id, start, end, flags, context):
+                    hits.add(term_id)
+
+                self._hyperscan_db.scan(data, match_event_handler=on_match)
+
+        if self._automaton is not None:
+            # Lowercasing is only an exact match for IGNORECASE on ASCII text
+            if text.isascii():
+                for _, indices in self._automaton.iter(text.lower()):
+                    hits.update(indices)
+            else:
+                hits.update(self._automaton_terms)
+
+        return frozenset(hits)
+
+    def finditer(self, text: str) -> Iterator[Tuple[str, re.Match]]:
+        """
+        Find all term matches in text, term by term in term list order.
+
+        Match objects may come from re, re2 or a bytes pattern; use their
+        start() and end() offsets to slice text rather than group().
+
+        Args:
+            text: Text to search
+
+        Yields:
+            Tuples of (term name, match object)
+        """
+        if text.isascii() and not _STR_ONLY_WHITESPACE.search(text):
+            data = text.encode('ascii')
+        else:
+            data = None
+
+        terms = self._candidate_terms(text, data)
+
+        if not terms:
+            return
+
+        def subject(matchers):
+            regex, ascii_matcher, ascii_bytes = matchers
+            if data is None:
+                return regex, text
+            return ascii_matcher, data if ascii_bytes else text
+
+        # One pass over the page rules out pages that match no term
+        screened = self._hyperscan_db is not None and data is not None
+        if self._combined_matchers is not None and len(terms) > 1 and not screened:
+            matcher, page = subject(self._combined_matchers)
+            if matcher.search(page) is None:
+                return
+
+        for index in sorted(terms):
+            matcher, page = subject(self._term_matchers[index])
+            term_name = self._names[index]
+            for match in matcher.finditer(page):
+                yield term_name, match
+
+
+def _compile_matchers(regex: re.Pattern, portable: bool) -> tuple:
+    """
+    Compile the matchers for running a regex on any text and on ASCII text.
+
+    For ASCII text the fastest available matcher is used.
+
+    Args:
+        regex: Compiled str pattern
+        portable: Whether _is_portable accepts the pattern
+
+    Returns:
+        Tuple of (str regex, ASCII matcher, whether the ASCII matcher
+        takes bytes)
+    """
+    if re2 is not None and portable:
+        options = re2.Options()
+        options.log_errors = False
+        try:
+            return regex, re2.compile(f"(?im){regex.pattern}", options), False
+        except re2.error:
+            pass
+
+    # Non-ASCII pattern characters (e.g. the Kelvin sign, which matches
+    # 'k' case-insensitively) cannot be expressed in a bytes pattern
+    if regex.pattern.isascii():
+        try:
+            return regex, re.compile(regex.pattern.encode('ascii'), REGEX_FLAGS), True
+        except re.error:
+            pass  # e.g. \u escapes are not valid in bytes patterns
+
+    return regex, regex, False
+
+
+def _compile_hyperscan(regexes: List[re.Pattern], indices: List[int]):
+    """
+    Compile a hyperscan database that reports matches by term index.
+
+    Args:
+        regexes: Compiled term patterns, in term list order
+        indices: Indices of the terms to include
+
+    Returns:
+        Hyperscan database, or None if there are no terms or one of them
+        is not supported
+    """
+    if not indices:
+        return None
+
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[regexes[index].pattern.encode('ascii') for index in indices],
+            ids=indices,
+            elements=len(indices),
+            flags=[HYPERSCAN_FLAGS] * len(indices)
+        )
+    except hyperscan.error:
+        return None
+
+    return database
+
+
+def _is_portable(regex: re.Pattern) -> bool:
+    """
+    Check whether re2 and hyperscan match a pattern the same way as re.
+
+    Only ASCII text is considered, and pages containing the whitespace
+    characters that \\s matches differently are excluded separately.
+    Patterns that can match the empty string are rejected, since re2
+    reports empty matches differently.
+
+    Args:
+        regex: Compiled term pattern
+
+    Returns:
+        True if the pattern can be handed to re2 or hyperscan
+    """
+    pattern = regex.pattern
+
+    if not pattern.isascii() or regex.flags & re.VERBOSE:
+        return False
+
+    if _NON_PORTABLE_SYNTAX.search(pattern):
+        return False
+
+    try:
+        parsed = sre_parse.parse(pattern, regex.flags)
+    except Exception:
+        return False
+
+    return parsed.getwidth()[0] > 0
+
+
+def _required_literal(regex: re.Pattern) -> Optional[str]:
+    """
+    Find the longest literal string that every match of a regex contains.
+
+    Only literal characters at the top level of the pattern are considered,
+    so alternation, optional items and groups never produce a literal.
+
+    Args:
+        regex: Compiled term pattern
+
+    Returns:
+        Lowercase ASCII literal of at least MIN_LITERAL_LENGTH characters,
+        or None if the pattern has no such literal
+    """
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return None
+
+    longest = ''
+    run = []
+
+    for op, value in list(parsed) + [(None, None)]:
+        if op == sre_parse.LITERAL and value < 128:
+            run.append(chr(value))
+            continue
+
+        if len(run) > len(longest):
+            longest = ''.join(run)
+        run = []
+
+    if len(longest) < MIN_LITERAL_LENGTH:
+        return None
+
+    return longest.lower()
+
 
 def _load_json_terms(file_path: Path) -> Dict[str, str]:
     """
@@ -85,7 +525,7 @@ def _load_csv_terms(file_path: Path) -> Dict[str, str]:
     Expected format:
     - First column: term name
     - Second column: regex pattern
-    - First row may be header (auto-detected)
+    - First non-blank row may be header (auto-detected)
 
     Args:
         file_path: Path to CSV file
@@ -94,33 +534,68 @@ def _load_csv_terms(file_path: Path) -> Dict[str, str]:
         Dictionary mapping term names to regex patterns
     """
     term_dict = {}
+    header_checked = False
 
-    with open(file_path, 'r', encoding='utf-8', newline='') as f:
-        # Try to detect if file has headers
-        sample = f.read(1024)
-        f.seek(0)
-
-        sniffer = csv.Sniffer()
-        has_header = sniffer.has_header(sample)
-
+    # utf-8-sig drops the byte order mark Excel writes at the start
+    with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
         reader = csv.reader(f)
 
-        if has_header:
-            next(reader)  # Skip header row
+        for row in reader:
+            if not any(cell.strip() for cell in row):
+                continue  # Skip blank rows
+
+            first_row = not header_checked
+            header_checked = True
 
-        for row_num, row in enumerate(reader, start=1):
             if len(row) < 2:
                 continue  # Skip rows with insufficient columns
 
             term_name = row[0].strip()
             pattern = row[1].strip()
 
+            if first_row and _is_header_row(term_name, pattern):
+                continue  # Skip header row
+
             if term_name and pattern:
                 term_dict[term_name] = pattern
 
     return term_dict
 
 
+def _is_header_row(term_name: str, pattern: str) -> bool:
+    """
+    Check whether the first CSV row is a header rather than a term.
+
+    A row is a header if both cells are recognized column names for their
+    column. Any other row is a term, so an invalid pattern in it is
+    reported when the term list is compiled.
+
+    Args:
+        term_name: First cell of the row
+        pattern: Second cell of the row
+
+    Returns:
+        True if the row looks like a header
+    """
+    return _is_column_name(term_name, CSV_NAME_COLUMNS) and _is_column_name(pattern, CSV_PATTERN_COLUMNS)
+
+
+def _is_column_name(cell: str, names: set) -> bool:
+    """
+    Check whether a CSV cell is one of the given column names.
+
+    Args:
+        cell: Cell text
+        names: Recognized column names
+
+    Returns:
+        True if the normalized cell is, or ends with, one of the names
+    """
+    column = re.sub(r'[\s-]+', '_', cell.strip().lower())
+
+    return column in names or any(column.endswith('_' + name) for name in names)
+
+
 def validate_term_list(term_dict: Dict[str, str]) -> List[str]:
     """
     Validate regex patterns in term list.
@@ -131,8 +606,6 @@ def validate_term_list(term_dict: Dict[str, str]) -> List[str]:
     Returns:
         List of error messages (empty if all valid)
     """
-    import re
-
     errors = []
 
     for name, pattern in term_dict.items():
@@ -0,0 +1,139 @@
+"""
+Tests for the term loader module.
+
+CombinedPattern is checked against plain re, scanning one term at a time,
+with each combination of the optional matching engines that is installed.
+"""
+
+import re
+import tempfile
+import unittest
+import warnings
+from pathlib import Path
+from unittest import mock
+
+from src import term_loader
+from src.term_loader import CombinedPattern, REGEX_FLAGS, compile_term_list, load_term_list
+
+
+ENGINES = ('hyperscan', 're2', 'ahocorasick')
+
+# (patterns, texts) where re, re2, hyperscan and bytes patterns disagree
+CASES = [
+    (['ab{,3}c'], ['xabbc', 'xab{,3}c']),
+    (['^', '$', r'^\s*$'], ['a\nb', '\n\n', 'a']),
+    (['[[:alpha:]]'], ['a] :] x', 'none here']),
+    ([r'foo\sbar', r'invoice\s+\d+'], [
+        'foo\x0bbar',
+        'x foo\x1fbar',
+        'INVOICE\x1c42',
+        'invoice 42 and foo bar',
+        'foo\x1cbar ü'
+    ]),
+    (['ı', 'k', 's'], ['I i', 'K K', 'ſ', 'plain text']),
+    (['http', r'https?://\S+', 'zzz'], ['see HTTP://x.org', 'no links', 'http\x1fx']),
+    # Terms the prefilters cannot screen must still be run
+    (['ab{,3}c', 'ı', r'https?://\S+'], ['xabbc I i', 'ü http://q', 'xabbc http://q']),
+]
+
+
+def _reference_matches(patterns, text):
+    """Find matches with re alone, one term at a time."""
+    matches = []
+    for name, pattern in patterns.items():
+        for match in re.finditer(pattern, text, REGEX_FLAGS):
+            matches.append((name, match.start(), match.end()))
+    return matches
+
+
+def _engine_configurations():
+    """Yield each subset of the installed optional engines to enable."""
+    installed = [name for name in ENGINES if getattr(term_loader, name) is not None]
+
+    for mask in range(2 ** len(installed)):
+        yield {name for bit, name in enumerate(installed) if mask & (1 << bit)}
+
+
+class CombinedPatternTest(unittest.TestCase):
+    """Compare CombinedPattern.finditer against plain re."""
+
+    def assert_matches_re(self, patterns, texts):
+        # [[:alpha:]] is a nested set warning in re
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', FutureWarning)
+            term_dict = compile_term_list(patterns)
+
+            for enabled in _engine_configurations():
+                disabled = {name: None for name in ENGINES if name not in enabled}
+
+                # re2 is looked up when matchers are compiled, during finditer
+                with mock.patch.dict(term_loader.__dict__, disabled):
+                    combined = CombinedPattern(term_dict)
+
+                    for text in texts:
+                        found = [
+                            (name, match.start(), match.end())
+                            for name, match in combined.finditer(text)
+                        ]
+                        with self.subTest(engines=sorted(enabled), text=text):
+                            self.assertEqual(found, _reference_matches(patterns, text))
+
+    def test_engines_agree_with_re(self):
+        for patterns, texts in CASES:
+            terms = {f'term_{index}': pattern for index, pattern in enumerate(patterns)}
+            # A second, unrelated term exercises the combined pattern
+            terms['digits'] = r'\d{3}'
+            self.assert_matches_re(terms, texts + ['123 ' + text for text in texts])
+
+    def test_example_terms_report_overlapping_matches(self):
+        patterns = {
+            'email': r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
+            'url': r'https?://[^\s]+',
+            'zip_code': r'\b\d{5}(?:-\d{4})?\b'
+        }
+        self.assert_matches_re(patterns, [
+            'https://example.com/contact?to=john@example.com',
+            'Mail 12345 or john@example.com'
+        ])
+
+
+class CsvTermListTest(unittest.TestCase):
+    """Check header detection when loading CSV term lists."""
+
+    def load_csv(self, content):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / 'terms.csv'
+            path.write_bytes(content.encode('utf-8'))
+            return {name: regex.pattern for name, regex in load_term_list(path).items()}
+
+    def test_header_rows_are_skipped(self):
+        for header in [
+            'term_name,pattern',
+            'Term Name,Regex Pattern',
+            '\ufeffterm_name,pattern',
+            '\nname,regex'
+        ]:
+            with self.subTest(header=header):
+                self.assertEqual(
+                    self.load_csv(header + '\nssn,\\d{3}-\\d{2}-\\d{4}\n'),
+                    {'ssn': r'\d{3}-\d{2}-\d{4}'}
+                )
+
+    def test_first_row_without_header_is_a_term(self):
+        self.assertEqual(
+            self.load_csv('ssn,\\d{3}-\\d{2}-\\d{4}\nzip,\\d{5}\n'),
+            {'ssn': r'\d{3}-\d{2}-\d{4}', 'zip': r'\d{5}'}
+        )
+
+
+    def test_invalid_first_term_is_reported(self):
+        with mock.patch.object(term_loader, 'log_exception') as log_exception:
+            terms = self.load_csv('ssn,\\d{3}-(\\d{2}\nzip,\\d{5}\n')
+
+        self.assertEqual(terms, {'zip': r'\d{5}'})
+        log_exception.assert_called_once()
+        self.assertIn("'ssn'", log_exception.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()